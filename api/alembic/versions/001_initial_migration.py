@@ -81,6 +81,7 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint('id')
     )
     op.create_index(op.f('ix_insights_id'), 'insights', ['id'], unique=False)
+    op.create_index('ix_insights_user_created', 'insights', ['user_id', 'created_at'], unique=False)
     
     # Create settings table
     op.create_table(
@@ -18,25 +18,28 @@ depends_on = None
 
 
 def upgrade():
-    # Index for user filtering and date range queries
-    op.execute("""
-        CREATE INDEX IF NOT EXISTS idx_entries_user_created
-        ON entries (user_id, created_at DESC)
-        WHERE is_deleted = FALSE
-    """)
-
-    # GIN index for tag containment queries (requires jsonb_path_ops for JSON type)
-    op.execute("""
-        CREATE INDEX IF NOT EXISTS idx_entries_tags
-        ON entries USING GIN ((tags::jsonb) jsonb_path_ops)
-    """)
-
-    # Partial index for active entries (most common filter pattern)
-    op.execute("""
-        CREATE INDEX IF NOT EXISTS idx_entries_active_user
-        ON entries (user_id, id)
-        WHERE is_deleted = FALSE
-    """)
+    # CONCURRENTLY avoids blocking writes to entries while the indexes build,
+    # but cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        # Index for user filtering and date range queries
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_entries_user_created
+            ON entries (user_id, created_at DESC)
+            WHERE is_deleted = FALSE
+        """)
+
+        # GIN index for tag containment queries (requires jsonb_path_ops for JSON type)
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_entries_tags
+            ON entries USING GIN ((tags::jsonb) jsonb_path_ops)
+        """)
+
+        # Partial index for active entries (most common filter pattern)
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_entries_active_user
+            ON entries (user_id, id)
+            WHERE is_deleted = FALSE
+        """)
 
 def downgrade():
     # Drop indexes in reverse order
@@ -15,22 +15,50 @@ branch_labels = None
 depends_on = None
 
 
+_BACKFILL_BATCH_SIZE = 1000
+
+
+def _backfill_nulls(table: str, column: str, value: str) -> None:
+    """Replace NULLs in bounded batches, committing after each one.
+
+    A single table-wide UPDATE holds row locks on every touched row and
+    produces one large burst of WAL. Batching keeps each transaction small
+    and lets concurrent writers and vacuum make progress in between.
+    Locked rows are waited on rather than skipped: the NOT NULL change that
+    follows needs every row to be backfilled.
+    """
+    bind = op.get_bind()
+    while True:
+        result = bind.execute(sa.text(
+            f"UPDATE {table} SET {column} = {value} "
+            f"WHERE id IN (SELECT id FROM {table} WHERE {column} IS NULL "
+            f"LIMIT {_BACKFILL_BATCH_SIZE})"
+        ))
+        if result.rowcount == 0:
+            break
+
+
 def upgrade() -> None:
-    # Fix existing NULL values in entries table
-    op.execute("UPDATE entries SET is_deleted = false WHERE is_deleted IS NULL")
+    # Set the defaults first so rows inserted during the backfill are not NULL
+    op.alter_column('entries', 'is_deleted',
+                    existing_type=sa.Boolean(),
+                    server_default=sa.text('false'))
+    op.alter_column('entry_embeddings', 'is_active',
+                    existing_type=sa.Boolean(),
+                    server_default=sa.text('true'))
 
-    # Fix existing NULL values in entry_embeddings table
-    op.execute("UPDATE entry_embeddings SET is_active = true WHERE is_active IS NULL")
+    # Fix existing NULL values, committing batch by batch
+    with op.get_context().autocommit_block():
+        _backfill_nulls('entries', 'is_deleted', 'false')
+        _backfill_nulls('entry_embeddings', 'is_active', 'true')
 
-    # Alter columns to have server defaults and be non-nullable
+    # Now that no NULLs remain, make the columns non-nullable
     op.alter_column('entries', 'is_deleted',
                     existing_type=sa.Boolean(),
-                    server_default=sa.text('false'),
                     nullable=False)
 
     op.alter_column('entry_embeddings', 'is_active',
                     existing_type=sa.Boolean(),
-                    server_default=sa.text('true'),
                     nullable=False)
 
 
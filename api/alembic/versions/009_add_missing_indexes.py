@@ -17,23 +17,23 @@ depends_on = None
 
 
 def upgrade() -> None:
-    # Index for insights table - frequently queried by user_id with created_at ordering
-    op.create_index(
-        'ix_insights_user_created',
-        'insights',
-        ['user_id', 'created_at'],
-        unique=False
-    )
-
-    # Index for settings table - queried on every request needing user settings
-    op.create_index(
-        'ix_settings_user_id',
-        'settings',
-        ['user_id'],
-        unique=True  # One settings row per user
-    )
+    with op.get_context().autocommit_block():
+        # Index for insights table - frequently queried by user_id with created_at ordering.
+        # Fresh installs already get it from 001; only older databases build it here.
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_insights_user_created "
+            "ON insights (user_id, created_at)"
+        )
+
+        # Index for settings table - queried on every request needing user settings
+        # (one settings row per user)
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS ix_settings_user_id "
+            "ON settings (user_id)"
+        )
 
 
 def downgrade() -> None:
-    op.drop_index('ix_settings_user_id', table_name='settings')
-    op.drop_index('ix_insights_user_created', table_name='insights')
+    # Revision 017 drops ix_settings_user_id again; tolerate its absence.
+    op.execute("DROP INDEX IF EXISTS ix_settings_user_id")
+    op.execute("DROP INDEX IF EXISTS ix_insights_user_created")
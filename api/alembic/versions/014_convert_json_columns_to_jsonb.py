@@ -0,0 +1,47 @@
+"""Convert entries.tags and insights.themes/actions to JSONB
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-10-16 00:00:00.000000
+
+These columns were created as plain JSON, which Postgres stores as text
+and re-parses on every read. idx_entries_tags therefore had to be built
+on a (tags::jsonb) cast expression, and every containment filter had to
+repeat that cast to match it. Storing JSONB lets the GIN index cover the
+column directly and lets `@>` work without a cast. The themes and
+actions arrays are switched too, so all array-of-strings columns share
+one type.
+"""
+from alembic import op
+
+revision = '014'
+down_revision = '013'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # The expression index references the old column type; rebuild it on
+    # the plain column once the type has changed.
+    op.execute("DROP INDEX IF EXISTS idx_entries_tags")
+    op.execute("ALTER TABLE entries ALTER COLUMN tags TYPE jsonb USING tags::jsonb")
+    op.execute("ALTER TABLE insights ALTER COLUMN themes TYPE jsonb USING themes::jsonb")
+    op.execute("ALTER TABLE insights ALTER COLUMN actions TYPE jsonb USING actions::jsonb")
+    # The type change has to commit first; the GIN build then runs without
+    # blocking entry writes.
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_entries_tags
+            ON entries USING GIN (tags jsonb_path_ops)
+        """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_entries_tags")
+    op.execute("ALTER TABLE insights ALTER COLUMN actions TYPE json USING actions::json")
+    op.execute("ALTER TABLE insights ALTER COLUMN themes TYPE json USING themes::json")
+    op.execute("ALTER TABLE entries ALTER COLUMN tags TYPE json USING tags::json")
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_entries_tags
+        ON entries USING GIN ((tags::jsonb) jsonb_path_ops)
+    """)
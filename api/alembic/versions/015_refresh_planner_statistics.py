@@ -0,0 +1,41 @@
+"""Refresh planner statistics after the schema changes
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-10-16 00:00:00.000000
+
+Earlier revisions backfilled and retyped whole tables (007 rewrote every
+entries.is_deleted NULL, 014 rewrote tags/themes/actions as JSONB) without
+refreshing statistics afterwards. Until autovacuum catches up, stale
+pg_statistic rows make the planner prefer sequential scans over the
+partial and GIN indexes. VACUUM cannot run inside a transaction block, so
+this revision steps out of Alembic's migration transaction.
+
+Ongoing refreshes are handled by the maintenance.analyze_all task.
+"""
+from alembic import op
+
+revision = '015'
+down_revision = '014'
+branch_labels = None
+depends_on = None
+
+_TABLES = (
+    'users',
+    'entries',
+    'attachments',
+    'insights',
+    'settings',
+    'prompt_interactions',
+)
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table in _TABLES:
+            op.execute(f"VACUUM (ANALYZE) {table}")
+
+
+def downgrade() -> None:
+    # Statistics refresh has nothing to undo.
+    pass
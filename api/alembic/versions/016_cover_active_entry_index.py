@@ -0,0 +1,57 @@
+"""Cover active-entry lookups with one partial index
+
+Revision ID: 016
+Revises: 015
+Create Date: 2026-10-16 00:00:00.000000
+
+Migration 002 created two partial indexes on active entries. One was
+(user_id, created_at DESC) for timeline ordering; the other was
+(user_id, id), which no query orders or ranges by. Replace both with a
+single (user_id, created_at DESC) index that INCLUDEs the id and mood
+columns. The per-user baseline aggregate and the timeline id/mood
+lookups can then be answered by index-only scans.
+
+title is deliberately not included: it is Fernet ciphertext, so it is
+several times larger than the plaintext and can never be used in a
+predicate. Carrying it would bloat every index page for no read that
+could avoid the heap anyway.
+"""
+from alembic import op
+
+revision = '016'
+down_revision = '015'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Build and drop concurrently so entry writes are never blocked. The new
+    # index goes in under a temporary name first so timeline queries always
+    # have one of the two to use.
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_entries_active_user_created
+            ON entries (user_id, created_at DESC)
+            INCLUDE (id, mood_user, mood_inferred)
+            WHERE is_deleted = FALSE
+        """)
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_entries_active_user")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_entries_user_created")
+    op.execute(
+        "ALTER INDEX idx_entries_active_user_created RENAME TO idx_entries_active_user"
+    )
+    op.execute("ANALYZE entries")
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_entries_active_user")
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_entries_user_created
+        ON entries (user_id, created_at DESC)
+        WHERE is_deleted = FALSE
+    """)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_entries_active_user
+        ON entries (user_id, id)
+        WHERE is_deleted = FALSE
+    """)
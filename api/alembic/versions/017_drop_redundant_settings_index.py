@@ -0,0 +1,31 @@
+"""Drop the redundant ix_settings_user_id index
+
+Revision ID: 017
+Revises: 016
+Create Date: 2026-10-16 00:00:00.000000
+
+The settings table has carried UniqueConstraint('user_id') since revision
+001, and Postgres backs that constraint with its own unique B-tree index
+(settings_user_id_key). Revision 009 added ix_settings_user_id on the same
+column, so every settings write maintained two identical indexes and both
+competed for cache. Lookups by user_id keep using the constraint's index.
+"""
+from alembic import op
+
+revision = '017'
+down_revision = '016'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_settings_user_id")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS ix_settings_user_id "
+            "ON settings (user_id)"
+        )
@@ -0,0 +1,51 @@
+"""Replace prompt_interactions single-column indexes with one covering index
+
+Revision ID: 018
+Revises: 017
+Create Date: 2026-10-16 00:00:00.000000
+
+Every read of prompt_interactions is scoped to one user. The stats
+endpoints then group by prompt_type/action and look at entry_id. Revision
+008 indexed user_id, prompt_type and action separately. prompt_type and
+action have a handful of distinct values each, so their indexes are never
+selective enough to be chosen, but every insert still maintains them. A
+single (user_id, created_at DESC) index that INCLUDEs the grouped columns
+serves those reads with an index-only scan. Its leading user_id column
+still backs the ON DELETE CASCADE from users.
+"""
+from alembic import op
+
+revision = '018'
+down_revision = '017'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_prompt_interactions_user_created
+            ON prompt_interactions (user_id, created_at DESC)
+            INCLUDE (prompt_type, action, entry_id)
+        """)
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_prompt_interactions_action")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_prompt_interactions_prompt_type")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_prompt_interactions_user_id")
+    op.execute("ANALYZE prompt_interactions")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_prompt_interactions_user_id "
+            "ON prompt_interactions (user_id)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_prompt_interactions_prompt_type "
+            "ON prompt_interactions (prompt_type)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_prompt_interactions_action "
+            "ON prompt_interactions (action)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_prompt_interactions_user_created")
@@ -0,0 +1,48 @@
+"""Store prompt_interactions.prompt_type and action as native enums
+
+Revision ID: 019
+Revises: 018
+Create Date: 2026-10-16 00:00:00.000000
+
+Both columns only ever hold one of a few fixed values (validated as
+Literals by the API), but were free-form VARCHAR. A Postgres enum stores
+each as a 4-byte OID instead of a varlena string, which shrinks the rows
+and the covering index that INCLUDEs them, and rejects stray values at
+the database. The ALTER rewrites the table and rebuilds its indexes under
+an ACCESS EXCLUSIVE lock; prompt_interactions is small and append-only.
+"""
+from alembic import op
+
+revision = '019'
+down_revision = '018'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE TYPE prompt_type_enum AS ENUM "
+        "('question', 'prompt', 'continuation', 'reverse')"
+    )
+    op.execute(
+        "CREATE TYPE prompt_action_enum AS ENUM "
+        "('displayed', 'clicked', 'cycled', 'dismissed', 'completed')"
+    )
+    op.execute("""
+        ALTER TABLE prompt_interactions
+            ALTER COLUMN prompt_type TYPE prompt_type_enum
+                USING prompt_type::prompt_type_enum,
+            ALTER COLUMN action TYPE prompt_action_enum
+                USING action::prompt_action_enum
+    """)
+    op.execute("ANALYZE prompt_interactions")
+
+
+def downgrade() -> None:
+    op.execute("""
+        ALTER TABLE prompt_interactions
+            ALTER COLUMN prompt_type TYPE VARCHAR USING prompt_type::text,
+            ALTER COLUMN action TYPE VARCHAR USING action::text
+    """)
+    op.execute("DROP TYPE prompt_action_enum")
+    op.execute("DROP TYPE prompt_type_enum")
@@ -1,5 +1,8 @@
+import asyncio
 import ssl
+import threading
 from celery import Celery
+from celery.signals import worker_process_init, worker_process_shutdown
 from app.core.config import settings
 
 celery_app = Celery(
@@ -7,12 +10,15 @@ celery_app = Celery(
     broker=settings.redis_url,
     # Result backend removed - all tasks use ignore_result=True
     # This eliminates ~30-50% of Redis operations from result cleanup/polling
+    backend=None,
 )
 
 # Base configuration - optimized for minimal Redis operations
 celery_config = {
-    "task_serializer": "json",
-    "accept_content": ["json"],
+    # msgpack is smaller and faster to encode than json. json stays accepted
+    # so messages queued by pre-msgpack producers still drain during rollout.
+    "task_serializer": "msgpack",
+    "accept_content": ["msgpack", "json"],
     "timezone": "UTC",
     "enable_utc": True,
     # No results stored (all tasks use ignore_result=True)
@@ -31,9 +37,16 @@ celery_config = {
         # Worker blocks for up to 5 min waiting for tasks instead of reconnecting
         "socket_timeout": 300,
         "socket_connect_timeout": 10,
+        # Cap the transport's Redis pool and keep its sockets alive so
+        # idle connections aren't silently dropped by the provider
+        "max_connections": 20,
+        "socket_keepalive": True,
+        "health_check_interval": 30,
     },
-    # Reduce broker connection pool to minimize idle connections
-    "broker_pool_limit": 1,
+    # Publisher connection pool. Connections are opened lazily, so this only
+    # bounds concurrent .delay() calls from API threads; a limit of 1 made
+    # them queue behind each other or reconnect.
+    "broker_pool_limit": 10,
     # Increase heartbeat interval to reduce keep-alive traffic
     "broker_heartbeat": 300,
     # Single worker process - sufficient for low-traffic/single-user
@@ -41,16 +54,92 @@ celery_config = {
     "worker_concurrency": 1,
     # Disable prefetching to reduce Redis operations
     "worker_prefetch_multiplier": 1,
+    # Keep retrying the broker at startup (Celery 6 changes the default)
+    "broker_connection_retry_on_startup": True,
+    # Ack after the task finishes so a killed worker's task is redelivered
+    # after visibility_timeout instead of lost. Tasks only write derived data
+    # (mood, reflection, insights), so a rerun is harmless.
+    "task_acks_late": True,
+    # No task sets rate_limit; skip the per-task token bucket bookkeeping
+    "worker_disable_rate_limits": True,
+    # Verify the broker certificate when using TLS (rediss://); None is
+    # Celery's default (plain TCP)
+    "broker_use_ssl": (
+        {"ssl_cert_reqs": ssl.CERT_REQUIRED}
+        if settings.redis_url.startswith("rediss://")
+        else None
+    ),
 }
 
-# Add SSL configuration if using TLS (rediss://)
-if settings.redis_url.startswith("rediss://"):
-    ssl_config = {
-        "ssl_cert_reqs": ssl.CERT_REQUIRED,
-    }
-    celery_config["broker_use_ssl"] = ssl_config
+celery_app.conf.update(celery_config)
+
+# There is deliberately no beat_schedule: a beat process would hold a Redis
+# connection and tick for two jobs that run once a week. Periodic tasks are
+# dispatched by the host's cron instead, e.g.
+#   0 3 * * 1  celery -A app.celery_app call insights.nightly_insights
+#   0 4 * * 0  celery -A app.celery_app call maintenance.analyze_all
+
+
+@worker_process_init.connect
+def _reset_db_pool_after_fork(**_kwargs):
+    """Give each forked worker child its own connections.
+
+    Pooled psycopg connections inherited from the parent share sockets with
+    it; using them from the child corrupts both sides. close=False drops the
+    references without sending a terminate on the parent's sockets.
+    """
+    from app.database import engine
+
+    engine.dispose(close=False)
+    # A loop inherited from the parent is bound to the parent's selector
+    _worker_loop.loop = None
+
+
+_worker_loop = threading.local()
+
+
+def run_async(coro):
+    """Run a coroutine to completion on this worker's persistent event loop.
+
+    Tasks call the async LLMService. asyncio.run() would build and tear down
+    a loop per call, and with it the shared httpx client and its keep-alive
+    connections to the provider. Reusing one loop per worker thread keeps
+    those connections warm across tasks.
+
+    If the wait is interrupted (SoftTimeLimitExceeded, KeyboardInterrupt, ...)
+    the coroutine is cancelled before the exception propagates, as
+    asyncio.run() would do; otherwise it would stay scheduled on the loop and
+    resume, still calling the provider, inside the next task's run_async().
+    """
+    loop = getattr(_worker_loop, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        _worker_loop.loop = loop
+    task = loop.create_task(coro)
+    try:
+        return loop.run_until_complete(task)
+    except BaseException:
+        if not task.done():
+            task.cancel()
+            loop.run_until_complete(asyncio.gather(task, return_exceptions=True))
+        raise
+
+
+@worker_process_shutdown.connect
+def _close_worker_loop(**_kwargs):
+    """Close the persistent loop's LLM client, then the loop itself."""
+    loop = getattr(_worker_loop, "loop", None)
+    if loop is None or loop.is_closed():
+        return
+    from app.services.llm_service import close_shared_client
+
+    try:
+        loop.run_until_complete(close_shared_client())
+    finally:
+        loop.close()
+        _worker_loop.loop = None
 
-celery_app.conf.update(**celery_config)
 
 # Auto-discover tasks in the jobs module
 celery_app.autodiscover_tasks(['app.jobs'])
@@ -1,4 +1,6 @@
 import os
+from functools import lru_cache
+from typing import Literal, Optional
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import field_validator
@@ -21,6 +23,20 @@ class Settings(BaseSettings):
             return v.replace("postgresql://", "postgresql+psycopg://", 1)
         return v
 
+    # psycopg prepares a statement server-side once it has run this many times
+    # on a connection. Set to 0 behind a transaction-mode pooler (e.g.
+    # Supabase's port 6543) that cannot carry prepared statements.
+    database_prepare_threshold: int = 5
+    # "queue" keeps a local connection pool (direct Postgres). "null" opens a
+    # connection per checkout, for deployments where an external pooler such
+    # as PgBouncer in transaction mode already does the pooling; it also
+    # turns off server-side prepared statements.
+    db_pool_mode: Literal["queue", "null"] = "queue"
+    # Per-transaction statement_timeout for API request sessions, so one slow
+    # query can't hold a connection and worker indefinitely. 0 disables.
+    # Background jobs use SessionLocal directly and are not limited.
+    db_request_statement_timeout_ms: int = 5000
+
     redis_url: str = "redis://redis:6379/0"
     jwt_secret: str = "change_me"  # MUST be changed in production!
     jwt_algorithm: str = "HS256"
@@ -77,6 +93,17 @@ class Settings(BaseSettings):
     # public hosts. Link-local / cloud-metadata ranges are blocked regardless.
     restrict_llm_endpoints: bool = False
 
+    # Optional cap on simultaneous LLM requests (chat streams included) per
+    # API process or worker; they share one connection pool per event loop.
+    # Unset means no cap, so long chat streams can't starve other callers.
+    llm_max_connections: Optional[int] = None
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Parse the environment and .env once; every caller shares the result."""
+    return Settings()
+
 
-settings = Settings()
+settings = get_settings()
 
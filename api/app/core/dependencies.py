@@ -1,7 +1,10 @@
 import hashlib
 import logging
+import threading
 from typing import Optional
 
+from cachetools import TTLCache
+
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
@@ -13,6 +16,39 @@ from app.models.user import User
 logger = logging.getLogger("app.auth")
 security = HTTPBearer(auto_error=False)
 
+# Detached User rows by id, so repeat requests skip the per-request lookup.
+# Routes only read scalar columns off current_user, never lazy relationships.
+# The cache is per process: a change made elsewhere is visible after at most
+# the TTL, and code that mutates a user must call invalidate_user().
+_USER_CACHE_TTL_SECONDS = 30
+_user_cache: TTLCache = TTLCache(maxsize=5000, ttl=_USER_CACHE_TTL_SECONDS)
+_user_cache_lock = threading.RLock()
+
+
+def invalidate_user(user_id: int) -> None:
+    """Drop a cached user so the next request reloads it from the database."""
+    with _user_cache_lock:
+        _user_cache.pop(user_id, None)
+
+
+def load_user(db: Session, user_id: int) -> Optional[User]:
+    """Return the user by id, from the per-process cache when possible.
+
+    Only active users are cached; callers must still check is_active.
+    """
+    with _user_cache_lock:
+        user = _user_cache.get(user_id)
+    if user is not None:
+        return user
+
+    user = db.get(User, user_id)
+    if user is not None and user.is_active:
+        # Detach so the cached instance is not tied to this request's session.
+        db.expunge(user)
+        with _user_cache_lock:
+            _user_cache[user_id] = user
+    return user
+
 
 def get_current_user(
     request: Request,
@@ -61,7 +97,7 @@ def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    user = db.query(User).filter(User.id == user_id).first()
+    user = load_user(db, user_id)
     if user is None or not user.is_active:
         logger.warning("User not found or inactive", extra={"user_id": user_id})
         raise HTTPException(
@@ -1,4 +1,5 @@
 import logging
+from functools import lru_cache
 from typing import Optional
 
 from cryptography.fernet import Fernet, InvalidToken
@@ -16,16 +17,23 @@ _TOKEN_PREFIX = "enc:"
 _CONTENT_PREFIX = "encv1:"
 
 
-def _get_fernet() -> Optional[Fernet]:
-    if not settings.encryption_key:
-        return None
+@lru_cache(maxsize=4)
+def _fernet_for(key: str) -> Optional[Fernet]:
+    # Every EncryptedText column read/write lands here, so build the Fernet
+    # (base64 decode + key split) once per key rather than once per value.
     try:
-        return Fernet(settings.encryption_key.encode())
+        return Fernet(key.encode())
     except Exception:
         logger.warning("Invalid ENCRYPTION_KEY — at-rest encryption disabled")
         return None
 
 
+def _get_fernet() -> Optional[Fernet]:
+    if not settings.encryption_key:
+        return None
+    return _fernet_for(settings.encryption_key)
+
+
 def encrypt_token(token: str) -> str:
     """Encrypt an LLM API token. Returns 'enc:<ciphertext>' or plaintext if key not configured."""
     fernet = _get_fernet()
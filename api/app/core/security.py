@@ -1,14 +1,45 @@
 import hashlib
+import hmac
 import secrets
-from datetime import datetime, timedelta
+import threading
+import time
+from datetime import timedelta
 from typing import Optional
 
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+import bcrypt
+import jwt
+from cachetools import TTLCache
+from jwt import InvalidTokenError
 
 from app.core.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+_BCRYPT_ROUNDS = 12
+_BCRYPT_MAX_BYTES = 72
+
+# Resolved once: settings are fixed for the life of the process. The secret is
+# kept as bytes so PyJWT doesn't re-encode it on every sign/verify.
+_JWT_SECRET = settings.jwt_secret.encode("utf-8")
+_JWT_ALGORITHM = settings.jwt_algorithm
+_JWT_ALGS = [_JWT_ALGORITHM]
+_JWT_DEFAULT_TTL_SECONDS = settings.jwt_access_token_expire_minutes * 60
+
+# Verified access-token payloads, keyed by SHA-256 of the token. A browser
+# session replays the same cookie on every request, so most decodes are
+# repeats. Entries are re-checked against `exp` on every hit and only
+# successful decodes are stored, so a forged token can never be served from
+# here. TTLCache is not thread-safe and sync dependencies run in a threadpool.
+_JWT_CACHE_TTL_SECONDS = 60
+_jwt_cache: TTLCache = TTLCache(maxsize=10_000, ttl=_JWT_CACHE_TTL_SECONDS)
+_jwt_cache_lock = threading.Lock()
+
+# Successful password verifications, so a client retrying a login it already
+# got right (double submit, token refresh race) doesn't pay ~100 ms of bcrypt
+# again. Keys are HMACs under a random per-process key, so the cache holds
+# nothing that can be attacked offline. Failures are never cached: a wrong
+# guess always costs the full bcrypt work.
+_VERIFY_CACHE_KEY = secrets.token_bytes(32)
+_verify_cache: TTLCache = TTLCache(maxsize=256, ttl=300)
+_verify_cache_lock = threading.Lock()
 
 
 def _sha256_hex(password: str) -> str:
@@ -16,6 +47,17 @@ def _sha256_hex(password: str) -> str:
     return hashlib.sha256(password.encode("utf-8")).hexdigest()
 
 
+def _checkpw(password: str, hashed_password: str) -> bool:
+    password_bytes = password.encode("utf-8")
+    if len(password_bytes) > _BCRYPT_MAX_BYTES:
+        return False
+    try:
+        return bcrypt.checkpw(password_bytes, hashed_password.encode("utf-8"))
+    except ValueError:
+        # Malformed or non-bcrypt hash
+        return False
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Verify a password against its bcrypt hash.
@@ -24,35 +66,64 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Falls back to SHA-256 preprocessing for passwords hashed before the
     72-byte validator was added (backward compat only).
     """
-    if pwd_context.verify(plain_password, hashed_password):
-        return True
-    # Backward compat: old passwords longer than 72 bytes were pre-hashed with SHA-256
-    if pwd_context.verify(_sha256_hex(plain_password), hashed_password):
-        return True
-    return False
+    cache_key = hmac.new(
+        _VERIFY_CACHE_KEY,
+        plain_password.encode("utf-8") + b"\0" + hashed_password.encode("utf-8"),
+        hashlib.sha256,
+    ).digest()
+    with _verify_cache_lock:
+        if cache_key in _verify_cache:
+            return True
+
+    verified = _checkpw(plain_password, hashed_password) or (
+        # Backward compat: old passwords longer than 72 bytes were pre-hashed with SHA-256
+        _checkpw(_sha256_hex(plain_password), hashed_password)
+    )
+    if verified:
+        with _verify_cache_lock:
+            _verify_cache[cache_key] = True
+    return verified
 
 
 def get_password_hash(password: str) -> str:
     """Hash a password with bcrypt. Passwords are validated to ≤72 bytes at the API layer."""
-    return pwd_context.hash(password)
+    return bcrypt.hashpw(
+        password.encode("utf-8"), bcrypt.gensalt(rounds=_BCRYPT_ROUNDS)
+    ).decode("ascii")
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.jwt_access_token_expire_minutes)
-    to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, settings.jwt_secret, algorithm=settings.jwt_algorithm)
+    ttl_seconds = (
+        int(expires_delta.total_seconds()) if expires_delta else _JWT_DEFAULT_TTL_SECONDS
+    )
+    # NumericDate per RFC 7519; the same value jwt.encode derives from a datetime
+    to_encode["exp"] = int(time.time()) + ttl_seconds
+    return jwt.encode(to_encode, _JWT_SECRET, algorithm=_JWT_ALGORITHM)
 
 
 def decode_access_token(token: str) -> Optional[dict]:
+    key = hashlib.sha256(token.encode()).digest()
+    with _jwt_cache_lock:
+        cached = _jwt_cache.get(key)
+    if cached is not None:
+        if cached.get("exp", 0) > time.time():
+            return dict(cached)
+        with _jwt_cache_lock:
+            _jwt_cache.pop(key, None)
+        return None
+
     try:
-        return jwt.decode(token, settings.jwt_secret, algorithms=[settings.jwt_algorithm])
-    except JWTError:
+        payload = jwt.decode(token, _JWT_SECRET, algorithms=_JWT_ALGS)
+    except InvalidTokenError:
         return None
 
+    # Only cache tokens with a numeric exp, so every hit can be re-checked.
+    if isinstance(payload.get("exp"), (int, float)):
+        with _jwt_cache_lock:
+            _jwt_cache[key] = payload
+    return dict(payload)
+
 
 def generate_refresh_token() -> str:
     """Generate a cryptographically secure opaque refresh token."""
@@ -1,25 +1,60 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.pool import NullPool
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
 
-# Production-ready connection pool configuration
+_use_external_pooler = settings.db_pool_mode == "null"
+
+if _use_external_pooler:
+    # The external pooler owns the connections; holding our own pool on top
+    # of it just pins server slots.
+    _pool_kwargs = {"poolclass": NullPool}
+else:
+    # Production-ready connection pool configuration
+    _pool_kwargs = {
+        "pool_size": 5,         # Number of persistent connections
+        "max_overflow": 10,     # Additional connections allowed beyond pool_size
+        "pool_recycle": 300,    # Recycle connections after 5 minutes (handles server-side timeouts)
+    }
+
 engine = create_engine(
     settings.database_url,
     echo=False,
     pool_pre_ping=True,      # Verify connections before use (handles stale connections)
-    pool_size=5,             # Number of persistent connections
-    max_overflow=10,         # Additional connections allowed beyond pool_size
-    pool_recycle=300,        # Recycle connections after 5 minutes (handles server-side timeouts)
+    query_cache_size=2000,   # Compiled-SQL cache; default 500 evicts hot ORM + Core statements
+    connect_args={
+        # Auto-prepare hot statements (user-by-id, entry lists) so Postgres
+        # skips parse/plan on repeats; None disables preparation entirely.
+        # Transaction-mode poolers can't carry prepared statements.
+        "prepare_threshold": (
+            None if _use_external_pooler else settings.database_prepare_threshold or None
+        ),
+    },
+    **_pool_kwargs,
 )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Sessions handed to API routes via get_db. Same engine, but every transaction
+# they begin is capped by statement_timeout.
+RequestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+if settings.db_request_statement_timeout_ms:
+    @event.listens_for(RequestSessionLocal, "after_begin")
+    def _set_request_statement_timeout(session, transaction, connection):
+        # is_local=true: scoped to this transaction, like SET LOCAL, so the
+        # pooled connection is back to the server default when returned.
+        connection.execute(
+            text("SELECT set_config('statement_timeout', :timeout, true)"),
+            {"timeout": f"{settings.db_request_statement_timeout_ms}ms"},
+        )
+
 Base = declarative_base()
 
 
 def get_db():
-    db = SessionLocal()
+    db = RequestSessionLocal()
     try:
         yield db
     finally:
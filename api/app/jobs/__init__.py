@@ -5,3 +5,4 @@ from app.jobs.insights_job import (  # noqa: F401
     nightly_insights_task,
 )
 from app.jobs.reflection_job import generate_reflection_task  # noqa: F401
+from app.jobs.maintenance_job import analyze_all_task  # noqa: F401
@@ -3,9 +3,8 @@ from app.models.user import User
 from app.models.insight import Insight
 from app.services.context_service import Intent, context_service
 from app.services.llm_service import get_generation_service_for_user
-from app.celery_app import celery_app
+from app.celery_app import celery_app, run_async
 from datetime import datetime, timedelta
-import asyncio
 
 
 @celery_app.task(
@@ -21,14 +20,12 @@ def generate_insights_task(user_id: int, days: int = 7):
     """
     Background task to generate insights for a user.
 
-    Note: Uses asyncio.run() to call async LLMService methods. This pattern
-    is intentional - the event loop creation overhead (~50-200μs) is negligible
-    compared to LLM inference time (~5-30s). Alternative approaches would add
-    complexity without meaningful performance benefit.
+    Async LLMService calls go through run_async() so the worker's event
+    loop and provider connections are reused across tasks.
     """
     db = SessionLocal()
     try:
-        user = db.query(User).filter(User.id == user_id).first()
+        user = db.get(User, user_id)
         if not user:
             return
 
@@ -36,9 +33,8 @@ def generate_insights_task(user_id: int, days: int = 7):
         generation_service = get_generation_service_for_user(db, user_id)
 
         # Pull the bounded recent window via ContextService.
-        bundle = asyncio.run(
+        bundle = run_async(
             context_service.get_context(
-                db=db,
                 user_id=user_id,
                 intent=Intent.INSIGHTS,
                 time_window_days=days,
@@ -56,7 +52,7 @@ def generate_insights_task(user_id: int, days: int = 7):
             for e in bundle.recent_window
         )
 
-        insights_data = asyncio.run(
+        insights_data = run_async(
             generation_service.generate_insights(recent_text)
         )
 
@@ -0,0 +1,38 @@
+from sqlalchemy import text
+from app.database import engine
+from app.celery_app import celery_app
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Tables whose row counts and value distributions drift with normal use.
+_ANALYZE_TABLES = (
+    "users",
+    "entries",
+    "attachments",
+    "insights",
+    "settings",
+    "prompt_interactions",
+)
+
+
+@celery_app.task(
+    name="maintenance.analyze_all",
+    ignore_result=True,
+    time_limit=600,  # Hard kill at 10 minutes
+    soft_time_limit=540,
+)
+def analyze_all_task():
+    """
+    Refresh planner statistics for the application tables.
+
+    Autovacuum's analyze threshold scales with table size, so bulk soft
+    deletes and imports on a large entries table can leave statistics stale
+    for a long time. Runs on a dedicated autocommit connection rather than
+    a Session so each ANALYZE commits on its own and holds no long-lived
+    transaction. Dispatched by an external cron (see docs/FEATURES.md).
+    """
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        for table in _ANALYZE_TABLES:
+            conn.execute(text(f"ANALYZE {table}"))
+    logger.info("Refreshed planner statistics for %d tables", len(_ANALYZE_TABLES))
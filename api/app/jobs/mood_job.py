@@ -3,8 +3,7 @@ from app.database import SessionLocal
 from app.models.entry import Entry
 from app.services.context_service import Intent, context_service
 from app.services.llm_service import get_generation_service_for_user
-from app.celery_app import celery_app
-import asyncio
+from app.celery_app import celery_app, run_async
 import httpx
 import logging
 import redis
@@ -32,14 +31,12 @@ def infer_mood_task(entry_id: int):
     """
     Background task to infer mood for an entry.
 
-    Note: Uses asyncio.run() to call async LLMService methods. This pattern
-    is intentional - the event loop creation overhead (~50-200μs) is negligible
-    compared to LLM inference time (~1-5s). Alternative approaches would add
-    complexity without meaningful performance benefit.
+    Async LLMService calls go through run_async() so the worker's event
+    loop and provider connections are reused across tasks.
     """
     db = SessionLocal()
     try:
-        entry = db.query(Entry).filter(Entry.id == entry_id).first()
+        entry = db.get(Entry, entry_id)
         if not entry:
             logger.warning(f"Entry {entry_id} not found for mood inference")
             return
@@ -51,9 +48,8 @@ def infer_mood_task(entry_id: int):
         # from this user's own labeled entries (when enough exist) plus the
         # user's mood baseline. This calibrates the LLM against the user's
         # personal scale rather than relying on a generic 1-5 rubric.
-        bundle = asyncio.run(
+        bundle = run_async(
             context_service.get_context(
-                db=db,
                 user_id=entry.user_id,
                 intent=Intent.MOOD,
                 anchor_entry_id=entry_id,
@@ -66,7 +62,7 @@ def infer_mood_task(entry_id: int):
             for ex in bundle.mood_examples
         ]
 
-        mood, confidence = asyncio.run(
+        mood, confidence = run_async(
             generation_service.infer_mood(
                 entry.content,
                 examples=examples_for_prompt or None,
@@ -1,11 +1,11 @@
 from datetime import datetime, timezone
+from sqlalchemy import false
 from app.database import SessionLocal
 from app.models.entry import Entry
 from app.services.context_service import Intent, context_service
 from app.services.llm_service import get_generation_service_for_user
 from app.services.reflection_cache import reflection_cache
-from app.celery_app import celery_app
-import asyncio
+from app.celery_app import celery_app, run_async
 import httpx
 import logging
 
@@ -28,10 +28,8 @@ def generate_reflection_task(user_id: int):
     """
     Background task to generate and cache reflection for a user.
 
-    Note: Uses asyncio.run() to call async LLMService methods. This pattern
-    is intentional - the event loop creation overhead (~50-200μs) is negligible
-    compared to LLM inference time (~5-30s). Alternative approaches would add
-    complexity without meaningful performance benefit.
+    Async LLMService calls go through run_async() so the worker's event
+    loop and provider connections are reused across tasks.
     """
     db = SessionLocal()
     try:
@@ -44,9 +42,8 @@ def generate_reflection_task(user_id: int):
         # Pull last 7 days of entries through ContextService — uniform path
         # with the rest of the AI features (mood/insights/chat), cold-start
         # handling, and local-LLM bundle capping.
-        bundle = asyncio.run(
+        bundle = run_async(
             context_service.get_context(
-                db=db,
                 user_id=user_id,
                 intent=Intent.REFLECTION,
                 time_window_days=7,
@@ -68,7 +65,7 @@ def generate_reflection_task(user_id: int):
         )
 
         # Generate reflection using OpenAI-compatible API
-        reflection = asyncio.run(generation_service.generate_reflection(entries_text))
+        reflection = run_async(generation_service.generate_reflection(entries_text))
 
         # Cache the result
         reflection_cache.set_reflection(user_id, reflection, status="complete")
@@ -125,7 +122,7 @@ def generate_entry_reflection_task(user_id: int, entry_id: int):
             .filter(
                 Entry.id == entry_id,
                 Entry.user_id == user_id,
-                Entry.is_deleted == False,  # noqa: E712
+                Entry.is_deleted == false(),
             )
             .first()
         )
@@ -144,9 +141,8 @@ def generate_entry_reflection_task(user_id: int, entry_id: int):
         # Pull recent past entries via ContextService. When echoes exist, the
         # reflection prompt frames today's entry against them; otherwise use
         # the generic single-entry reflection prompt.
-        bundle = asyncio.run(
+        bundle = run_async(
             context_service.get_context(
-                db=db,
                 user_id=user_id,
                 intent=Intent.REFLECTION,
                 anchor_entry_id=entry_id,
@@ -167,7 +163,7 @@ def generate_entry_reflection_task(user_id: int, entry_id: int):
                 }
                 for e in bundle.related_entries
             ]
-            reflection_text = asyncio.run(
+            reflection_text = run_async(
                 generation_service.generate_entry_reflection_with_echoes(
                     focus_entry_text=f"{entry.title or 'Untitled'}\n{entry.content}",
                     focus_entry_date=entry.created_at.date().isoformat(),
@@ -175,7 +171,7 @@ def generate_entry_reflection_task(user_id: int, entry_id: int):
                 )
             )
         else:
-            reflection_text = asyncio.run(
+            reflection_text = run_async(
                 generation_service.generate_reflection(entry_text)
             )
 
@@ -1,3 +1,5 @@
+from sqlalchemy.orm import configure_mappers
+
 from app.models.user import User
 from app.models.entry import Entry
 from app.models.insight import Insight
@@ -16,3 +18,7 @@ __all__ = [
     "PromptAction",
 ]
 
+# Resolve relationship() targets and back_populates for every model now,
+# at import, rather than lazily inside whichever request or task first
+# queries a mapped class.
+configure_mappers()
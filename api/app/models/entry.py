@@ -1,4 +1,5 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, JSON, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Boolean, Index, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.encryption import EncryptedText
@@ -7,12 +8,23 @@ from app.database import Base
 
 class Entry(Base):
     __tablename__ = "entries"
+    __table_args__ = (
+        # Mirrors migration 016. Queries must filter with
+        # `Entry.is_deleted == false()` for the planner to match the predicate.
+        Index(
+            "idx_entries_active_user",
+            "user_id",
+            text("created_at DESC"),
+            postgresql_include=["id", "mood_user", "mood_inferred"],
+            postgresql_where=text("is_deleted = false"),
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     title = Column(EncryptedText, nullable=True)
     content = Column(EncryptedText, nullable=False)
-    tags = Column(JSON, default=list)
+    tags = Column(JSONB, default=list)
     mood_user = Column(Integer, nullable=True)  # 1-5 from UI
     mood_inferred = Column(Integer, nullable=True)  # 1-5 from LLM
     mood_confidence = Column(String(8), nullable=True)  # "high" | "medium" | "low"
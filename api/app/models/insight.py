@@ -1,4 +1,5 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -6,12 +7,15 @@ from app.database import Base
 
 class Insight(Base):
     __tablename__ = "insights"
+    __table_args__ = (
+        Index("ix_insights_user_created", "user_id", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     summary = Column(Text, nullable=False)
-    themes = Column(JSON, default=list)
-    actions = Column(JSON, default=list)
+    themes = Column(JSONB, default=list)
+    actions = Column(JSONB, default=list)
     period_start = Column(DateTime(timezone=True), nullable=False)
     period_end = Column(DateTime(timezone=True), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Enum
+from sqlalchemy import Column, Integer, Text, DateTime, ForeignKey, Enum, Index, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -20,14 +20,34 @@ class PromptAction(str, enum.Enum):
     COMPLETED = "completed"
 
 
+def _enum_values(enum_cls) -> list[str]:
+    # Store the lowercase values ("question"), not the member names, so the
+    # enum labels match the strings the API and existing rows use.
+    return [member.value for member in enum_cls]
+
+
 class PromptInteraction(Base):
     __tablename__ = "prompt_interactions"
+    __table_args__ = (
+        Index(
+            "ix_prompt_interactions_user_created",
+            "user_id",
+            text("created_at DESC"),
+            postgresql_include=["prompt_type", "action", "entry_id"],
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     prompt_text = Column(Text, nullable=False)
-    prompt_type = Column(String, nullable=False)  # question, prompt, continuation, reverse
-    action = Column(String, nullable=False)  # displayed, clicked, cycled, dismissed, completed
+    prompt_type = Column(
+        Enum(PromptType, name="prompt_type_enum", values_callable=_enum_values),
+        nullable=False,
+    )
+    action = Column(
+        Enum(PromptAction, name="prompt_action_enum", values_callable=_enum_values),
+        nullable=False,
+    )
     entry_id = Column(Integer, ForeignKey("entries.id", ondelete="CASCADE"), nullable=True)
     source_entry_id = Column(Integer, ForeignKey("entries.id", ondelete="SET NULL"), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
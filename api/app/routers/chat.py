@@ -5,22 +5,26 @@ Auth: client must first call GET /auth/ws-ticket (cookie-authenticated) to obtai
 a short-lived one-time ticket, then connect with ?ticket=<ticket> in the URL.
 This avoids exposing long-lived JWTs in server logs.
 """
+import asyncio
 import json
 import logging
 import time
 from collections import deque
-from contextlib import contextmanager
-from typing import Deque, Dict, List, Optional
+from contextlib import aclosing, contextmanager
+from typing import AsyncIterator, Deque, Dict, List, Optional, Tuple
 
+import httpx
+import orjson
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Query
+from sqlalchemy import false
 from websockets.exceptions import ConnectionClosed
 
+from app.core.dependencies import load_user
 from app.database import SessionLocal
 from app.models.entry import Entry
-from app.models.user import User
 from app.services.context_service import Intent, context_service
 from app.services.llm_service import get_generation_service_for_user
-from app.services.reflection_cache import reflection_cache
+from app.services.reflection_cache import get_context_version, reflection_cache
 from app.services.token_store import token_store
 
 router = APIRouter()
@@ -34,6 +38,15 @@ WS_SERVER_ERROR = 1011
 # Per-connection rate limiting
 _MAX_MESSAGE_LENGTH = 2000      # chars — reject longer messages
 _MAX_MESSAGES_PER_MINUTE = 10  # sliding window per connection
+_MAX_HISTORY_MESSAGES = 10     # user + assistant turns sent back to the LLM
+# Reuse a socket's related-entries context across turns while the user's
+# context version is unchanged (entry writes and forget bump it), and never
+# for longer than this.
+_RELATED_ENTRIES_TTL_SECONDS = 60
+# Coalesce streamed tokens into one frame per window instead of one frame
+# (JSON encode + socket write) per token. Also the longest a received token
+# waits before it is sent.
+_TOKEN_FLUSH_INTERVAL_SECONDS = 0.03
 
 
 def _check_rate_limit(timestamps: Deque[float]) -> bool:
@@ -68,6 +81,9 @@ Guidelines:
 - Never make assumptions about information not in the entries
 """
 
+# Split around the per-refresh slot; the tail has no other placeholders.
+_CHAT_PROMPT_ALL_PARTS = tuple(CHAT_SYSTEM_PROMPT_ALL.split("{related_entries}"))
+
 CHAT_SYSTEM_PROMPT_ENTRY = """You are a thoughtful journaling assistant helping the user reflect on one specific journal entry.
 
 The conversation is anchored to this single entry. Stay focused on it and what the user says about it; avoid inventing connections to other entries.
@@ -99,6 +115,19 @@ def get_db_session():
         db.close()
 
 
+_COMPLETE_FRAME = orjson.dumps({"type": "complete"}).decode()
+
+
+async def _send(websocket: WebSocket, payload: Dict) -> None:
+    """send_json, but encoded with orjson (the stream loop sends many frames)."""
+    await websocket.send_text(orjson.dumps(payload).decode())
+
+
+def _load_generation_service(user_id: int):
+    with get_db_session() as db:
+        return get_generation_service_for_user(db, user_id)
+
+
 async def authenticate_websocket(websocket: WebSocket, ticket: Optional[str]) -> Optional[int]:
     """
     Authenticate a WebSocket connection using a one-time ticket.
@@ -115,25 +144,26 @@ async def authenticate_websocket(websocket: WebSocket, ticket: Optional[str]) ->
         await websocket.close(code=WS_AUTH_FAILED, reason="Invalid or expired ticket")
         return None
 
+    # The ticket was issued to a cookie-authenticated request moments ago, so
+    # the user is almost always in the auth cache; the session only opens a
+    # connection on a miss, which keeps reconnect bursts off the pool.
     with get_db_session() as db:
-        user = db.query(User).filter(User.id == user_id, User.is_active == True).first()
-        if user is None:
-            await websocket.close(code=WS_USER_NOT_FOUND, reason="User not found or inactive")
-            return None
+        user = load_user(db, user_id)
+    if user is None or not user.is_active:
+        await websocket.close(code=WS_USER_NOT_FOUND, reason="User not found or inactive")
+        return None
 
     return user_id
 
 
 async def get_related_entries(user_id: int, k: int = 3) -> List[Dict]:
-    """Get recent entries via ContextService using a short-lived session."""
+    """Get recent entries via ContextService, which runs on its own session."""
     try:
-        with get_db_session() as db:
-            bundle = await context_service.get_context(
-                db=db,
-                user_id=user_id,
-                intent=Intent.CHAT,
-                k=k,
-            )
+        bundle = await context_service.get_context(
+            user_id=user_id,
+            intent=Intent.CHAT,
+            k=k,
+        )
         return [
             {
                 "title": e.title,
@@ -148,6 +178,57 @@ async def get_related_entries(user_id: int, k: int = 3) -> List[Dict]:
         return []
 
 
+async def _coalesce_tokens(tokens: AsyncIterator[str]) -> AsyncIterator[str]:
+    """
+    Join streamed tokens into chunks, at most one per flush window.
+
+    A token is never held longer than the window: if the provider pauses
+    mid-stream, what has arrived is flushed on the deadline. The pending read
+    is awaited through asyncio.wait rather than wait_for, which would cancel
+    it on timeout and with it the upstream stream. Closing this generator
+    closes `tokens`.
+    """
+    pending: List[str] = []
+    last_sent = 0.0
+    next_token = asyncio.ensure_future(anext(tokens))
+    try:
+        while True:
+            if pending:
+                remaining = last_sent + _TOKEN_FLUSH_INTERVAL_SECONDS - time.monotonic()
+                done, _ = await asyncio.wait({next_token}, timeout=max(remaining, 0.0))
+                if not done:
+                    yield "".join(pending)
+                    pending.clear()
+                    last_sent = time.monotonic()
+                    continue
+            try:
+                token = await next_token
+            except StopAsyncIteration:
+                break
+            next_token = asyncio.ensure_future(anext(tokens))
+            pending.append(token)
+            now = time.monotonic()
+            if now - last_sent >= _TOKEN_FLUSH_INTERVAL_SECONDS:
+                yield "".join(pending)
+                pending.clear()
+                last_sent = now
+        if pending:
+            yield "".join(pending)
+    finally:
+        if not next_token.done():
+            next_token.cancel()
+            await asyncio.gather(next_token, return_exceptions=True)
+        await tokens.aclose()
+
+
+async def _load_related_context(user_id: int) -> Tuple[int, List[Dict]]:
+    """Return the user's context version and the related entries it covers."""
+    # Version first: a bump landing between the two reads then fails the
+    # next turn's version check instead of pinning entries it missed.
+    version = await asyncio.to_thread(get_context_version, user_id)
+    return version, await get_related_entries(user_id, k=3)
+
+
 def format_related_entries(entries: List[Dict]) -> str:
     if not entries:
         return "No related entries found."
@@ -199,7 +280,7 @@ async def chat_websocket(
                 entry = db.query(Entry).filter(
                     Entry.id == entry_id,
                     Entry.user_id == user_id,
-                    Entry.is_deleted == False,
+                    Entry.is_deleted == false(),
                 ).first()
                 if entry is None:
                     await websocket.close(code=WS_AUTH_FAILED, reason="Entry not found")
@@ -214,12 +295,19 @@ async def chat_websocket(
         await websocket.accept()
         websocket_accepted = True
 
-        cached = reflection_cache.get_reflection(user_id)
+        # Independent blocking lookups (Redis, Postgres): overlap them in
+        # worker threads instead of paying each round trip in turn. In
+        # all-entries mode the first turn's related entries come along too,
+        # so the first message goes straight to the LLM.
+        lookups = [
+            asyncio.to_thread(reflection_cache.get_reflection, user_id),
+            asyncio.to_thread(_load_generation_service, user_id),
+        ]
+        if not pinned_entry:
+            lookups.append(_load_related_context(user_id))
+        cached, generation_service, *prefetched = await asyncio.gather(*lookups)
         reflection_text = cached.get("reflection", "") if cached else ""
 
-        with get_db_session() as db:
-            generation_service = get_generation_service_for_user(db, user_id)
-
         context_payload: Dict = {
             "type": "context",
             "scope": "entry" if pinned_entry else "all",
@@ -232,14 +320,39 @@ async def chat_websocket(
                 "title": pinned_entry["title"],
                 "created_at": pinned_entry["created_at"],
             }
-        await websocket.send_json(context_payload)
+        await _send(websocket, context_payload)
 
-        conversation_history: List[Dict[str, str]] = []
+        # Only the tail is ever sent to the LLM; bound it so long-lived
+        # sockets don't accumulate the whole conversation in memory.
+        conversation_history: Deque[Dict[str, str]] = deque(maxlen=_MAX_HISTORY_MESSAGES)
         message_timestamps: Deque[float] = deque()
+        # The system prompt only changes when its inputs do: once per socket
+        # for a pinned entry, on related-entries refresh otherwise.
+        system_prompt: Optional[str] = None
+        if pinned_entry:
+            system_prompt = CHAT_SYSTEM_PROMPT_ENTRY.format(
+                entry_date=pinned_entry["created_at"],
+                entry_title=pinned_entry["title"] or "Untitled",
+                entry_content=pinned_entry["content"][:_MAX_PINNED_ENTRY_CHARS],
+            )
+        else:
+            # The reflection is fixed for the socket: bind it into the head
+            # once, so refreshes only concatenate the related-entries block.
+            prompt_head, prompt_tail = _CHAT_PROMPT_ALL_PARTS
+            prompt_head = prompt_head.format(reflection=reflection_text)
+        related_entries_at = 0.0
+        related_version = 0
+        if prefetched:
+            related_version, related_entries = prefetched[0]
+            if related_entries:
+                system_prompt = (
+                    prompt_head + format_related_entries(related_entries) + prompt_tail
+                )
+                related_entries_at = time.monotonic()
 
         while True:
             try:
-                data = await websocket.receive_json()
+                data = orjson.loads(await websocket.receive_text())
 
                 if data.get("type") != "chat_message":
                     continue
@@ -250,7 +363,7 @@ async def chat_websocket(
 
                 # Enforce message length limit
                 if len(user_message) > _MAX_MESSAGE_LENGTH:
-                    await websocket.send_json({
+                    await _send(websocket, {
                         "type": "error",
                         "message": f"Message too long (max {_MAX_MESSAGE_LENGTH} characters)"
                     })
@@ -258,7 +371,7 @@ async def chat_websocket(
 
                 # Enforce per-connection rate limit
                 if not _check_rate_limit(message_timestamps):
-                    await websocket.send_json({
+                    await _send(websocket, {
                         "type": "error",
                         "message": "Too many messages. Please wait before sending another."
                     })
@@ -266,32 +379,42 @@ async def chat_websocket(
 
                 conversation_history.append({"role": "user", "content": user_message})
 
-                if pinned_entry:
-                    system_prompt = CHAT_SYSTEM_PROMPT_ENTRY.format(
-                        entry_date=pinned_entry["created_at"],
-                        entry_title=pinned_entry["title"] or "Untitled",
-                        entry_content=pinned_entry["content"][:_MAX_PINNED_ENTRY_CHARS],
-                    )
-                else:
-                    related_entries = await get_related_entries(user_id, k=3)
-                    system_prompt = CHAT_SYSTEM_PROMPT_ALL.format(
-                        reflection=reflection_text,
-                        related_entries=format_related_entries(related_entries),
-                    )
-
-                messages = [{"role": "system", "content": system_prompt}] + conversation_history[-10:]
+                if not pinned_entry:
+                    now = time.monotonic()
+                    # Forgotten or edited entries must leave the prompt as
+                    # soon as the write lands, not when the TTL runs out.
+                    context_version = await asyncio.to_thread(get_context_version, user_id)
+                    if (
+                        system_prompt is None
+                        or context_version != related_version
+                        or now - related_entries_at > _RELATED_ENTRIES_TTL_SECONDS
+                    ):
+                        related_entries = await get_related_entries(user_id, k=3)
+                        related_version = context_version
+                        system_prompt = (
+                            prompt_head
+                            + format_related_entries(related_entries)
+                            + prompt_tail
+                        )
+                        # An empty list may be a swallowed lookup failure;
+                        # retry next turn rather than pinning it.
+                        related_entries_at = now if related_entries else 0.0
+
+                messages = [{"role": "system", "content": system_prompt}, *conversation_history]
 
                 full_response = ""
                 client_gone = False
-                # Breaking out of the async for closes the upstream generator,
-                # which cancels the httpx stream so we stop billing LLM tokens.
-                async for token_content in generation_service.chat_completion_stream(messages, temperature=0.7):
-                    full_response += token_content
-                    try:
-                        await websocket.send_json({"type": "token", "content": token_content})
-                    except (WebSocketDisconnect, ConnectionClosed):
-                        client_gone = True
-                        break
+                # Leaving the block closes the upstream generator, which
+                # cancels the httpx stream so we stop billing LLM tokens.
+                stream = generation_service.chat_completion_stream(messages, temperature=0.7)
+                async with aclosing(_coalesce_tokens(stream)) as chunks:
+                    async for chunk in chunks:
+                        full_response += chunk
+                        try:
+                            await _send(websocket, {"type": "token", "content": chunk})
+                        except (WebSocketDisconnect, ConnectionClosed):
+                            client_gone = True
+                            break
 
                 if client_gone:
                     logger.info(f"Client disconnected mid-stream for user {user_id}; aborting generation")
@@ -299,7 +422,7 @@ async def chat_websocket(
 
                 conversation_history.append({"role": "assistant", "content": full_response})
                 try:
-                    await websocket.send_json({"type": "complete"})
+                    await websocket.send_text(_COMPLETE_FRAME)
                 except (WebSocketDisconnect, ConnectionClosed):
                     logger.info(f"Client disconnected before completion for user {user_id}")
                     break
@@ -308,11 +431,19 @@ async def chat_websocket(
                 logger.info(f"WebSocket disconnected for user {user_id}")
                 break
             except json.JSONDecodeError:
-                await websocket.send_json({"type": "error", "message": "Invalid JSON message"})
+                await _send(websocket, {"type": "error", "message": "Invalid JSON message"})
+            except httpx.PoolTimeout:
+                # Every LLM connection this process may open is in use
+                # (llm_max_connections); the socket stays usable.
+                logger.warning("LLM connection pool exhausted", extra={"user_id": user_id})
+                await _send(websocket, {
+                    "type": "error",
+                    "message": "The assistant is busy right now. Please try again in a moment."
+                })
             except Exception:
                 logger.exception("Error processing chat message", extra={"user_id": user_id})
                 try:
-                    await websocket.send_json({"type": "error", "message": "Failed to process message"})
+                    await _send(websocket, {"type": "error", "message": "Failed to process message"})
                 except (WebSocketDisconnect, ConnectionClosed):
                     break
 
@@ -20,6 +20,7 @@ from fastapi import (
     status,
 )
 from pydantic import BaseModel
+from sqlalchemy import false, lambda_stmt, select
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from app.database import get_db
@@ -336,7 +337,7 @@ def _build_retry_query(db: Session, user_id: int, now: datetime):
     """
     return db.query(Entry.id).filter(
         Entry.user_id == user_id,
-        Entry.is_deleted.is_(False),
+        Entry.is_deleted == false(),
         Entry.created_at < (now - _RETRY_MIN_AGE),
     )
 
@@ -428,18 +429,26 @@ async def retry_failed_entries(
     )
 
 
+# Every row in a page is decrypted and serialized before the response goes
+# out, so page size is bounded; clients page through larger histories.
+_MAX_LIST_LIMIT = 500
+
+
 @router.get("", response_model=List[EntryResponse])
 async def list_entries(
-    skip: int = 0,
-    limit: int = 100,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=_MAX_LIST_LIMIT),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    entries = db.query(Entry).filter(
-        Entry.user_id == current_user.id,
-        Entry.is_deleted == False
-    ).order_by(Entry.created_at.desc()).offset(skip).limit(limit).all()
-    return entries
+    user_id = current_user.id
+    # lambda_stmt: the statement is built and cache-keyed once per process;
+    # later calls only rebind user_id/skip/limit.
+    stmt = lambda_stmt(lambda: select(Entry).where(
+        Entry.user_id == user_id,
+        Entry.is_deleted == false()
+    ).order_by(Entry.created_at.desc()).offset(skip).limit(limit))
+    return db.execute(stmt).scalars().all()
 
 
 @router.get("/{entry_id}", response_model=EntryResponse)
@@ -448,11 +457,13 @@ async def get_entry(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    entry = db.query(Entry).filter(
+    user_id = current_user.id
+    stmt = lambda_stmt(lambda: select(Entry).where(
         Entry.id == entry_id,
-        Entry.user_id == current_user.id,
-        Entry.is_deleted == False
-    ).first()
+        Entry.user_id == user_id,
+        Entry.is_deleted == false()
+    ))
+    entry = db.execute(stmt).scalar_one_or_none()
     if not entry:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Entry not found")
     return entry
@@ -478,7 +489,7 @@ def _rank_related_entries(
         db.query(Entry)
         .filter(
             Entry.user_id == user_id,
-            Entry.is_deleted.is_(False),
+            Entry.is_deleted == false(),
             Entry.id != source.id,
         )
         .order_by(Entry.created_at.desc())
@@ -510,7 +521,7 @@ async def get_related_entries(
     entry = db.query(Entry).filter(
         Entry.id == entry_id,
         Entry.user_id == current_user.id,
-        Entry.is_deleted == False,
+        Entry.is_deleted == false(),
     ).first()
     if not entry:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Entry not found")
@@ -545,7 +556,7 @@ async def get_entry_echoes(
     entry = db.query(Entry).filter(
         Entry.id == entry_id,
         Entry.user_id == current_user.id,
-        Entry.is_deleted == False,
+        Entry.is_deleted == false(),
     ).first()
     if not entry:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Entry not found")
@@ -612,7 +623,7 @@ async def get_entry_reflection(
     entry = db.query(Entry).filter(
         Entry.id == entry_id,
         Entry.user_id == current_user.id,
-        Entry.is_deleted == False,
+        Entry.is_deleted == false(),
     ).first()
     if not entry:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Entry not found")
@@ -641,7 +652,7 @@ async def regenerate_entry_reflection(
     entry = db.query(Entry).filter(
         Entry.id == entry_id,
         Entry.user_id == current_user.id,
-        Entry.is_deleted == False,
+        Entry.is_deleted == false(),
     ).first()
     if not entry:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Entry not found")
@@ -665,15 +676,20 @@ async def update_entry(
     entry = db.query(Entry).filter(
         Entry.id == entry_id,
         Entry.user_id == current_user.id,
-        Entry.is_deleted == False
+        Entry.is_deleted == false()
     ).first()
     if not entry:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Entry not found")
     
     if entry_data.title is not None:
         entry.title = entry_data.title
-    if entry_data.content is not None:
+    # Editors resend the full body on every save; only a real edit should
+    # discard the entry's reflection and force another LLM pass.
+    if entry_data.content is not None and entry_data.content != entry.content:
         entry.content = entry_data.content
+        entry.reflection = None
+        entry.reflection_status = None
+        entry.reflection_generated_at = None
     if entry_data.tags is not None:
         entry.tags = entry_data.tags
     if entry_data.mood_user is not None:
@@ -684,13 +700,6 @@ async def update_entry(
 
     db.commit()
     db.refresh(entry)
-    
-    # Invalidate entry reflection if content changed.
-    if entry_data.content is not None:
-        entry.reflection = None
-        entry.reflection_status = None
-        entry.reflection_generated_at = None
-        db.commit()
 
     # Invalidate cached reflection so it regenerates on next view
     reflection_cache.delete_reflection(current_user.id)
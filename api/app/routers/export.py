@@ -1,43 +1,66 @@
-import json
+from typing import Iterator
 
-from fastapi import APIRouter, Depends, Response
-from sqlalchemy.orm import Session
+import orjson
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+from sqlalchemy import false
 
 from app.core.dependencies import get_current_user
-from app.database import get_db
+from app.database import RequestSessionLocal
 from app.models.entry import Entry
 from app.models.user import User
 
 router = APIRouter()
 
+_EXPORT_BATCH_SIZE = 500
+
+
+def _export_lines(user_id: int) -> Iterator[bytes]:
+    # Owns its session: the response body is produced after the endpoint
+    # returns, and rows are pulled through a server-side cursor in batches
+    # so memory stays flat regardless of how many entries the user has.
+    db = RequestSessionLocal()
+    try:
+        rows = (
+            db.query(
+                Entry.id,
+                Entry.title,
+                Entry.content,
+                Entry.tags,
+                Entry.mood_user,
+                Entry.mood_inferred,
+                Entry.created_at,
+                Entry.updated_at,
+            )
+            .filter(
+                Entry.user_id == user_id,
+                Entry.is_deleted == false(),
+            )
+            .execution_options(yield_per=_EXPORT_BATCH_SIZE)
+        )
+        for entry in rows:
+            yield orjson.dumps(
+                {
+                    "id": entry.id,
+                    "title": entry.title,
+                    "content": entry.content,
+                    "tags": entry.tags,
+                    "mood_user": entry.mood_user,
+                    "mood_inferred": entry.mood_inferred,
+                    "created_at": entry.created_at.isoformat(),
+                    "updated_at": entry.updated_at.isoformat() if entry.updated_at else None,
+                },
+                option=orjson.OPT_APPEND_NEWLINE,
+            )
+    finally:
+        db.close()
+
 
 @router.get("/entries")
-async def export_entries(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
-):
-    """Export journal entries as JSONL (one JSON object per line)."""
-    entries = db.query(Entry).filter(
-        Entry.user_id == current_user.id,
-        Entry.is_deleted == False,
-    ).all()
-
-    lines = [
-        json.dumps({
-            "id": entry.id,
-            "title": entry.title,
-            "content": entry.content,
-            "tags": entry.tags,
-            "mood_user": entry.mood_user,
-            "mood_inferred": entry.mood_inferred,
-            "created_at": entry.created_at.isoformat(),
-            "updated_at": entry.updated_at.isoformat() if entry.updated_at else None,
-        })
-        for entry in entries
-    ]
-
-    return Response(
-        content="\n".join(lines),
+async def export_entries(current_user: User = Depends(get_current_user)):
+    """Export journal entries as JSONL (one JSON object per line), streamed."""
+    return StreamingResponse(
+        _export_lines(current_user.id),
         media_type="application/x-ndjson",
         headers={"Content-Disposition": "attachment; filename=entries.jsonl"},
     )
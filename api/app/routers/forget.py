@@ -64,7 +64,9 @@ async def forget_entry(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    entry = db.query(Entry).filter(
+    # Only existence is needed; loading the Entry would fetch and decrypt
+    # content, title and reflection just to overwrite or delete them.
+    entry = db.query(Entry.id).filter(
         Entry.id == entry_id,
         Entry.user_id == current_user.id,
     ).first()
@@ -77,12 +79,22 @@ async def forget_entry(
     try:
         if hard_delete:
             # Hard delete: commit the DB delete FIRST so we never orphan DB rows.
-            # Capture attachment paths before deleting the row (cascade will remove them).
+            # Capture attachment paths before deleting the rows. Attachments
+            # are removed explicitly (their FK has no ON DELETE CASCADE) with
+            # bulk deletes, so no extracted_text or entry content is loaded.
             attachment_paths = [
-                a.filepath
-                for a in db.query(Attachment).filter(Attachment.entry_id == entry_id).all()
+                filepath
+                for (filepath,) in db.query(Attachment.filepath).filter(
+                    Attachment.entry_id == entry_id
+                )
             ]
-            db.delete(entry)
+            db.query(Attachment).filter(Attachment.entry_id == entry_id).delete(
+                synchronize_session=False
+            )
+            db.query(Entry).filter(
+                Entry.id == entry_id,
+                Entry.user_id == current_user.id,
+            ).delete(synchronize_session=False)
             db.commit()
 
             # Now attempt to delete files. Orphan files are recoverable via
@@ -99,12 +111,20 @@ async def forget_entry(
                     )
         else:
             # Soft forget: wipe PII while keeping the row for referential integrity.
-            entry.content = ""
-            entry.title = None
-            entry.tags = []
-            entry.mood_user = None
-            entry.mood_inferred = None
-            entry.is_deleted = True
+            db.query(Entry).filter(
+                Entry.id == entry_id,
+                Entry.user_id == current_user.id,
+            ).update(
+                {
+                    Entry.content: "",
+                    Entry.title: None,
+                    Entry.tags: [],
+                    Entry.mood_user: None,
+                    Entry.mood_inferred: None,
+                    Entry.is_deleted: True,
+                },
+                synchronize_session=False,
+            )
             db.commit()
     except SQLAlchemyError:
         db.rollback()
@@ -4,6 +4,7 @@ import os
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request
+from sqlalchemy import false
 from sqlalchemy.orm import Session
 
 from app.core.dependencies import get_current_user
@@ -88,7 +89,7 @@ async def get_semantic_mood_insights(
         Entry.mood_inferred,
     ).filter(
         Entry.user_id == current_user.id,
-        Entry.is_deleted.is_not(True),
+        Entry.is_deleted == false(),
     ).all()
 
     total_entries = len(entries)
@@ -8,7 +8,7 @@ from typing import List, Optional
 import httpx
 from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.orm import Session
-from sqlalchemy import func, case
+from sqlalchemy import case, false, func
 from app.core.rate_limit import limiter
 
 logger = logging.getLogger(__name__)
@@ -156,7 +156,7 @@ async def get_writing_suggestions(
         db.query(Entry)
         .filter(
             Entry.user_id == current_user.id,
-            Entry.is_deleted.is_not(True),
+            Entry.is_deleted == false(),
             Entry.created_at >= seven_days_ago,
         )
         .order_by(Entry.created_at.desc())
@@ -233,7 +233,7 @@ async def _get_preferred_type(user_id: int, db: Session) -> Optional[str]:
             rate = row.completed / row.displayed
             if rate > best_rate:
                 best_rate = rate
-                best_type = row.prompt_type
+                best_type = row.prompt_type.value
 
     return best_type if best_rate > 0 else None
 
@@ -386,7 +386,7 @@ async def get_reverse_prompt(
         db.query(Entry)
         .filter(
             Entry.user_id == current_user.id,
-            Entry.is_deleted.is_not(True),
+            Entry.is_deleted == false(),
             Entry.created_at >= thirty_days_ago,
         )
         .order_by(Entry.created_at.desc())
@@ -454,7 +454,7 @@ async def get_welcome_back(
         db.query(Entry)
         .filter(
             Entry.user_id == current_user.id,
-            Entry.is_deleted.is_not(True),
+            Entry.is_deleted == false(),
             Entry.created_at >= seven_days_ago,
         )
         .order_by(Entry.created_at.desc())
@@ -3,6 +3,7 @@ from datetime import datetime, timezone
 from typing import List
 
 from fastapi import APIRouter, Depends, Request
+from sqlalchemy import false
 from sqlalchemy.orm import Session
 
 from app.core.dependencies import get_current_user
@@ -62,7 +63,7 @@ async def keyword_search(
 
     query = db.query(Entry).filter(
         Entry.user_id == current_user.id,
-        Entry.is_deleted.is_(False),
+        Entry.is_deleted == false(),
     )
     if search_request.date_range:
         if search_request.date_range.start:
@@ -70,6 +71,7 @@ async def keyword_search(
         if search_request.date_range.end:
             query = query.filter(Entry.created_at <= search_request.date_range.end)
     if search_request.tags:
+        # JSONB containment (`@>`) is served by the idx_entries_tags GIN index.
         query = query.filter(Entry.tags.contains(search_request.tags))
 
     query = query.order_by(Entry.created_at.desc())
@@ -3,6 +3,9 @@ from typing import Optional
 from datetime import datetime
 
 _MAX_PASSWORD_BYTES = 72  # bcrypt hard limit
+# UTF-8 uses at most 4 bytes per code point, so any password this short fits
+# without encoding it to measure.
+_MAX_UNCHECKED_PASSWORD_CHARS = _MAX_PASSWORD_BYTES // 4
 
 
 class UserCreate(BaseModel):
@@ -13,6 +16,8 @@ class UserCreate(BaseModel):
     @field_validator("password")
     @classmethod
     def password_length(cls, v: str) -> str:
+        if len(v) <= _MAX_UNCHECKED_PASSWORD_CHARS:
+            return v
         if len(v.encode("utf-8")) > _MAX_PASSWORD_BYTES:
             raise ValueError(f"Password must be {_MAX_PASSWORD_BYTES} bytes or fewer")
         return v
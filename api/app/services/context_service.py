@@ -1,6 +1,7 @@
 """Centralized, recency-based context provider for AI features."""
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
 import logging
@@ -10,9 +11,10 @@ from enum import Enum
 from typing import List, Optional, Sequence
 from urllib.parse import urlparse
 
-from sqlalchemy import func
+from sqlalchemy import Row, false, func
 from sqlalchemy.orm import Session
 
+from app.database import SessionLocal
 from app.models.entry import Entry
 from app.models.settings import Settings as UserSettings
 from app.services.reflection_cache import get_cached_context, set_cached_context
@@ -25,6 +27,18 @@ MOOD_EXAMPLE_MIN_LABELS = 5
 MOOD_EXAMPLE_PER_LEVEL = 1
 _LOCAL_HOSTNAMES = {"localhost", "127.0.0.1", "::1", "ollama", "host.docker.internal"}
 _LOCAL_HOSTNAME_SUFFIXES = (".local", ".internal", ".lan")
+# Columns _row_to_summary reads. Context only reads entries, so these are
+# selected as plain rows: no ORM instances, identity-map bookkeeping, or
+# fetching and decrypting Entry.reflection, which context never uses.
+_SUMMARY_COLUMNS = (
+    Entry.id,
+    Entry.title,
+    Entry.content,
+    Entry.created_at,
+    Entry.mood_user,
+    Entry.mood_inferred,
+    Entry.tags,
+)
 
 
 class Intent(str, Enum):
@@ -95,7 +109,7 @@ def _params_hash(*parts: object) -> str:
     return hashlib.sha256(canon).hexdigest()[:16]
 
 
-def _row_to_summary(entry: Entry, score: float = 1.0) -> EntrySummary:
+def _row_to_summary(entry: Row, score: float = 1.0) -> EntrySummary:
     return EntrySummary(
         id=entry.id,
         title=entry.title,
@@ -112,6 +126,44 @@ class ContextService:
     """Selects bounded chronological context without embeddings."""
 
     async def get_context(
+        self,
+        user_id: int,
+        intent: Intent,
+        *,
+        anchor_text: Optional[str] = None,
+        anchor_entry_id: Optional[int] = None,
+        time_window_days: Optional[int] = None,
+        k: int = 8,
+        mmr_lambda: float = 0.65,
+        generation_url: Optional[str] = None,
+    ) -> ContextBundle:
+        # Every step is a blocking DB or Redis call; run them in a worker
+        # thread so chat turns don't stall the event loop for other sockets.
+        # The thread owns its session: cancelling the awaiting task (a client
+        # disconnect, a job's soft time limit) doesn't stop the thread, so it
+        # must never share a Session the caller may close meanwhile.
+        return await asyncio.to_thread(
+            self._build_context_in_own_session,
+            user_id,
+            intent,
+            anchor_text=anchor_text,
+            anchor_entry_id=anchor_entry_id,
+            time_window_days=time_window_days,
+            k=k,
+            mmr_lambda=mmr_lambda,
+            generation_url=generation_url,
+        )
+
+    def _build_context_in_own_session(
+        self, user_id: int, intent: Intent, **kwargs
+    ) -> ContextBundle:
+        db = SessionLocal()
+        try:
+            return self.build_context(db, user_id, intent, **kwargs)
+        finally:
+            db.close()
+
+    def build_context(
         self,
         db: Session,
         user_id: int,
@@ -224,7 +276,7 @@ class ContextService:
                 func.avg(Entry.mood_user).label("mood_user_mean"),
                 func.max(Entry.created_at).label("last_entry_at"),
             )
-            .filter(Entry.user_id == user_id, Entry.is_deleted.is_(False))
+            .filter(Entry.user_id == user_id, Entry.is_deleted == false())
             .one()
         )
         return UserBaseline(
@@ -248,11 +300,11 @@ class ContextService:
         self, db: Session, user_id: int, entry_id: int
     ) -> Optional[EntrySummary]:
         entry = (
-            db.query(Entry)
+            db.query(*_SUMMARY_COLUMNS)
             .filter(
                 Entry.id == entry_id,
                 Entry.user_id == user_id,
-                Entry.is_deleted.is_(False),
+                Entry.is_deleted == false(),
             )
             .first()
         )
@@ -268,8 +320,8 @@ class ContextService:
     ) -> List[EntrySummary]:
         if limit <= 0:
             return []
-        query = db.query(Entry).filter(
-            Entry.user_id == user_id, Entry.is_deleted.is_(False)
+        query = db.query(*_SUMMARY_COLUMNS).filter(
+            Entry.user_id == user_id, Entry.is_deleted == false()
         )
         if exclude_entry_id is not None:
             query = query.filter(Entry.id != exclude_entry_id)
@@ -286,10 +338,10 @@ class ContextService:
     ) -> List[EntrySummary]:
         start = datetime.now(timezone.utc) - timedelta(days=window_days)
         rows = (
-            db.query(Entry)
+            db.query(*_SUMMARY_COLUMNS)
             .filter(
                 Entry.user_id == user_id,
-                Entry.is_deleted.is_(False),
+                Entry.is_deleted == false(),
                 Entry.created_at >= start,
             )
             .order_by(Entry.created_at.desc())
@@ -301,31 +353,43 @@ class ContextService:
     def _build_mood_examples(
         self, db: Session, user_id: int, anchor_entry_id: int
     ) -> List[MoodExample]:
+        # Pick examples from (id, mood) alone, then fetch and decrypt content
+        # for just the handful chosen instead of every labeled entry.
         rows = (
-            db.query(Entry)
+            db.query(Entry.id, Entry.mood_user)
             .filter(
                 Entry.user_id == user_id,
                 Entry.id != anchor_entry_id,
                 Entry.mood_user.isnot(None),
-                Entry.is_deleted.is_(False),
+                Entry.is_deleted == false(),
             )
             .order_by(Entry.created_at.desc())
             .all()
         )
-        examples: List[MoodExample] = []
+        chosen: List[tuple[int, int]] = []
         counts: dict[int, int] = {}
-        for row in rows:
-            mood = int(row.mood_user)
+        for entry_id, mood_user in rows:
+            mood = int(mood_user)
             if counts.get(mood, 0) >= MOOD_EXAMPLE_PER_LEVEL:
                 continue
-            examples.append(
-                MoodExample(
-                    entry_id=row.id,
-                    content=row.content or "",
-                    mood=mood,
-                )
-            )
+            chosen.append((entry_id, mood))
             counts[mood] = counts.get(mood, 0) + 1
+        if not chosen:
+            return []
+
+        contents = dict(
+            db.query(Entry.id, Entry.content)
+            .filter(Entry.id.in_([entry_id for entry_id, _ in chosen]))
+            .all()
+        )
+        examples = [
+            MoodExample(
+                entry_id=entry_id,
+                content=contents.get(entry_id) or "",
+                mood=mood,
+            )
+            for entry_id, mood in chosen
+        ]
         return sorted(examples, key=lambda example: example.mood)
 
     def _default_window_for_intent(self, intent: Intent) -> int:
@@ -383,11 +447,11 @@ class ContextService:
             if anchor_id is not None:
                 all_ids.append(anchor_id)
             rows = (
-                db.query(Entry)
+                db.query(*_SUMMARY_COLUMNS)
                 .filter(
                     Entry.id.in_(all_ids),
                     Entry.user_id == user_id,
-                    Entry.is_deleted.is_(False),
+                    Entry.is_deleted == false(),
                 )
                 .all()
                 if all_ids
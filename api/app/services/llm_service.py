@@ -12,11 +12,14 @@ This service supports any LLM provider that implements the OpenAI API standard:
 
 The service uses the chat completions format for text generation.
 """
+import asyncio
 import hashlib
+import http.cookiejar
 import httpx
 import json
 import re
 import logging
+import weakref
 from typing import List, Dict, Optional, Any, AsyncGenerator, Tuple
 
 from app.core.config import settings as app_settings
@@ -55,6 +58,45 @@ class LLMStreamError(Exception):
         self.provider_url = provider_url
 
 
+# One pooled client per event loop. httpx connections are bound to the loop
+# that opened them, so the API's loop and each Celery worker's run_async()
+# loop get their own; entries drop out when a loop is garbage-collected.
+# A chat stream holds its connection until the reply finishes, so a set
+# llm_max_connections caps concurrent LLM calls per process; callers beyond
+# it wait up to the pool timeout, then get httpx.PoolTimeout. Owners of a
+# loop call close_shared_client() before shutting it down.
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _shared_client() -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            timeout=httpx.Timeout(connect=10.0, read=300.0, write=10.0, pool=10.0),
+            limits=httpx.Limits(
+                max_keepalive_connections=10,
+                max_connections=app_settings.llm_max_connections,
+            ),
+            headers={"Content-Type": "application/json"},
+            # Shared across users and providers: never carry cookies over
+            cookies=http.cookiejar.CookieJar(
+                policy=http.cookiejar.DefaultCookiePolicy(allowed_domains=[])
+            ),
+        )
+        _clients[loop] = client
+    return client
+
+
+async def close_shared_client() -> None:
+    """Close the running loop's pooled client, if it has one."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
 class LLMService:
     """
     Service for interacting with OpenAI-compatible LLM APIs.
@@ -100,24 +142,11 @@ class LLMService:
             body_snippet=body_snippet,
         )
 
-    def _create_client(self) -> httpx.AsyncClient:
-        """
-        Create a new httpx.AsyncClient.
-
-        Note: We intentionally create a fresh client for each request to avoid
-        'Event loop is closed' errors when used with asyncio.run() in Celery workers.
-        The client creation overhead (~1ms) is negligible compared to LLM inference
-        time (~5-30s).
-        """
-        headers = {"Content-Type": "application/json"}
+    def _request_headers(self) -> Dict[str, str]:
+        """Per-request auth headers; the pooled client is shared across users."""
         if self.api_token:
-            headers["Authorization"] = f"Bearer {self.api_token}"
-
-        return httpx.AsyncClient(
-            timeout=httpx.Timeout(connect=10.0, read=300.0, write=10.0, pool=10.0),
-            limits=httpx.Limits(max_keepalive_connections=5, max_connections=10),
-            headers=headers
-        )
+            return {"Authorization": f"Bearer {self.api_token}"}
+        return {}
 
     async def chat_completion(
         self,
@@ -140,23 +169,23 @@ class LLMService:
             payload["max_tokens"] = max_tokens
 
         endpoint = f"{self.base_url}/v1/chat/completions"
-        async with self._create_client() as client:
-            response = await client.post(
-                endpoint,
-                json=payload,
-                timeout=120.0
-            )
-            self._raise_for_provider_status(response, endpoint)
-            data = response.json()
-
-            # OpenAI format returns {"choices": [{"message": {"content": "..."}}]}
-            if "choices" in data and len(data["choices"]) > 0:
-                return data["choices"][0]["message"]["content"]
-            # Fallback for simple format {"response": "..."}
-            elif "response" in data:
-                return data["response"]
-            else:
-                raise ValueError(f"Unexpected chat completion response format: {data}")
+        response = await _shared_client().post(
+            endpoint,
+            json=payload,
+            headers=self._request_headers(),
+            timeout=120.0
+        )
+        self._raise_for_provider_status(response, endpoint)
+        data = response.json()
+
+        # OpenAI format returns {"choices": [{"message": {"content": "..."}}]}
+        if "choices" in data and len(data["choices"]) > 0:
+            return data["choices"][0]["message"]["content"]
+        # Fallback for simple format {"response": "..."}
+        elif "response" in data:
+            return data["response"]
+        else:
+            raise ValueError(f"Unexpected chat completion response format: {data}")
 
     async def chat_completion_stream(
         self,
@@ -180,67 +209,67 @@ class LLMService:
             payload["max_tokens"] = max_tokens
 
         endpoint = f"{self.base_url}/v1/chat/completions"
-        async with self._create_client() as client:
-            async with client.stream(
-                "POST",
-                endpoint,
-                json=payload,
-                timeout=120.0
-            ) as response:
-                if response.status_code >= 400:
-                    try:
-                        body_bytes = await response.aread()
-                        body = body_bytes.decode("utf-8", errors="replace")
-                    except Exception:
-                        body = ""
-                    body_snippet = body[:500] if body else ""
-                    self._logger.warning(
-                        "LLM provider error",
-                        extra={
-                            "provider_url": endpoint,
-                            "model": self.model,
-                            "status_code": response.status_code,
-                            "body_snippet": body_snippet,
-                        },
-                    )
-                    raise LLMProviderError(
-                        f"LLM provider returned {response.status_code}",
-                        status_code=response.status_code,
-                        provider_url=endpoint,
-                        body_snippet=body_snippet,
-                    )
-
+        async with _shared_client().stream(
+            "POST",
+            endpoint,
+            json=payload,
+            headers=self._request_headers(),
+            timeout=120.0
+        ) as response:
+            if response.status_code >= 400:
                 try:
-                    async for line in response.aiter_lines():
-                        if not line:
+                    body_bytes = await response.aread()
+                    body = body_bytes.decode("utf-8", errors="replace")
+                except Exception:
+                    body = ""
+                body_snippet = body[:500] if body else ""
+                self._logger.warning(
+                    "LLM provider error",
+                    extra={
+                        "provider_url": endpoint,
+                        "model": self.model,
+                        "status_code": response.status_code,
+                        "body_snippet": body_snippet,
+                    },
+                )
+                raise LLMProviderError(
+                    f"LLM provider returned {response.status_code}",
+                    status_code=response.status_code,
+                    provider_url=endpoint,
+                    body_snippet=body_snippet,
+                )
+
+            try:
+                async for line in response.aiter_lines():
+                    if not line:
+                        continue
+                    # SSE format: "data: {...}" or "data: [DONE]"
+                    if line.startswith("data: "):
+                        data_str = line[6:]  # Remove "data: " prefix
+                        if data_str.strip() == "[DONE]":
+                            break
+                        try:
+                            data = json.loads(data_str)
+                            if "choices" in data and len(data["choices"]) > 0:
+                                delta = data["choices"][0].get("delta", {})
+                                content = delta.get("content", "")
+                                if content:
+                                    yield content
+                        except json.JSONDecodeError:
+                            self._logger.debug(
+                                "Dropping malformed SSE frame",
+                                extra={"line": line[:200]},
+                            )
                             continue
-                        # SSE format: "data: {...}" or "data: [DONE]"
-                        if line.startswith("data: "):
-                            data_str = line[6:]  # Remove "data: " prefix
-                            if data_str.strip() == "[DONE]":
-                                break
-                            try:
-                                data = json.loads(data_str)
-                                if "choices" in data and len(data["choices"]) > 0:
-                                    delta = data["choices"][0].get("delta", {})
-                                    content = delta.get("content", "")
-                                    if content:
-                                        yield content
-                            except json.JSONDecodeError:
-                                self._logger.debug(
-                                    "Dropping malformed SSE frame",
-                                    extra={"line": line[:200]},
-                                )
-                                continue
-                except (
-                    httpx.ReadError,
-                    httpx.RemoteProtocolError,
-                    httpx.TimeoutException,
-                ) as e:
-                    raise LLMStreamError(
-                        "Upstream stream interrupted",
-                        provider_url=endpoint,
-                    ) from e
+            except (
+                httpx.ReadError,
+                httpx.RemoteProtocolError,
+                httpx.TimeoutException,
+            ) as e:
+                raise LLMStreamError(
+                    "Upstream stream interrupted",
+                    provider_url=endpoint,
+                ) from e
 
     async def generate_reflection(self, entries_text: str) -> str:
         """Generate reflection from entries using chat completions."""
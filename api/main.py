@@ -15,6 +15,7 @@ from sqlalchemy.orm import Session
 from app.core.rate_limit import limiter
 from app.database import engine, Base, get_db
 from app.routers import auth, entries, search, insights, settings, forget, export, reflections, chat, prompts
+from app.services.llm_service import close_shared_client
 from app.services.reflection_cache import reflection_cache
 
 # Configure logging with environment-based level
@@ -83,6 +84,7 @@ async def lifespan(app: FastAPI):
     yield
     # Shutdown
     logger.info("Application shutdown: cleaning up resources")
+    await close_shared_client()
 
 
 app = FastAPI(
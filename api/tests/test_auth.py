@@ -154,3 +154,52 @@ def test_get_me_with_invalid_token():
             headers={"Authorization": "Bearer invalid_token_here"}
         )
         assert response.status_code == 401
+
+
+def test_decode_access_token_cache_rechecks_expiry(monkeypatch):
+    from app.core import security
+
+    token = security.create_access_token({"sub": "42"})
+    first = security.decode_access_token(token)
+    assert first["sub"] == "42"
+
+    # A cached payload must still be rejected once its exp has passed.
+    monkeypatch.setattr(security.time, "time", lambda: first["exp"] + 1)
+    assert security.decode_access_token(token) is None
+
+
+def test_decode_access_token_does_not_cache_failures():
+    import hashlib
+
+    from app.core import security
+
+    token = "not.a.jwt"
+    assert security.decode_access_token(token) is None
+    assert hashlib.sha256(token.encode()).digest() not in security._jwt_cache
+
+
+def test_deactivated_user_rejected_after_invalidate(db):
+    from app.core.dependencies import _user_cache, invalidate_user
+
+    _delete_user("deactivate@example.com")
+    with TestClient(app) as session_client:
+        user_id = session_client.post(
+            "/auth/register",
+            json={
+                "email": "deactivate@example.com",
+                "username": "deactivate",
+                "password": "testpass123"
+            }
+        ).json()["id"]
+        session_client.post(
+            "/auth/login",
+            json={"email": "deactivate@example.com", "password": "testpass123"}
+        )
+        assert session_client.get("/auth/me").status_code == 200
+        assert user_id in _user_cache
+
+        db.query(User).filter(User.id == user_id).update({"is_active": False})
+        db.commit()
+        invalidate_user(user_id)
+
+        assert session_client.get("/auth/me").status_code == 401
@@ -0,0 +1,91 @@
+"""Guards for the Celery configuration.
+
+DB-free: importing the app only builds config; no broker connection is made.
+"""
+
+from pathlib import Path
+
+import app
+from app.celery_app import celery_app
+
+
+def test_single_celery_app_module():
+    modules = sorted(
+        p.relative_to(Path(app.__file__).parent).as_posix()
+        for p in Path(app.__file__).parent.rglob("celery_app.py")
+    )
+    assert modules == ["celery_app.py"]
+
+
+def test_no_result_backend():
+    # Every task sets ignore_result=True; a result backend would only add
+    # Redis round trips and expiry sweeps.
+    assert celery_app.conf.result_backend is None
+    assert celery_app.conf.task_ignore_result is True
+
+
+def test_no_beat_schedule():
+    # Periodic jobs are dispatched by an external cron (see celery_app.py).
+    assert not celery_app.conf.beat_schedule
+
+
+def test_periodic_tasks_registered():
+    import app.jobs  # noqa: F401 -- registers tasks
+
+    assert "insights.nightly_insights" in celery_app.tasks
+    assert "maintenance.analyze_all" in celery_app.tasks
+
+
+
+def test_run_async_cancels_coroutine_on_time_limit():
+    import asyncio
+    import signal
+
+    import pytest
+
+    from app.celery_app import run_async
+
+    class TimeLimit(BaseException):
+        """Raised from a signal handler, like Celery's SoftTimeLimitExceeded."""
+
+    def on_alarm(signum, frame):
+        raise TimeLimit
+
+    events = []
+
+    async def llm_call():
+        try:
+            await asyncio.sleep(0.3)
+        except asyncio.CancelledError:
+            events.append("cancelled")
+            raise
+        events.append("finished")
+
+    previous = signal.signal(signal.SIGALRM, on_alarm)
+    try:
+        signal.setitimer(signal.ITIMER_REAL, 0.05)
+        with pytest.raises(TimeLimit):
+            run_async(llm_call())
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+    # The timed-out call must not resume inside the next task's run.
+    run_async(asyncio.sleep(0.4))
+    assert events == ["cancelled"]
+
+
+def test_worker_shutdown_closes_loop_and_llm_client():
+    from app.celery_app import _close_worker_loop, _worker_loop, run_async
+    from app.services.llm_service import _shared_client
+
+    async def grab():
+        return _shared_client()
+
+    client = run_async(grab())
+    loop = _worker_loop.loop
+    _close_worker_loop()
+    assert client.is_closed
+    assert loop.is_closed()
+    # A later task starts a fresh loop.
+    assert run_async(grab()) is not client
@@ -0,0 +1,48 @@
+"""Tests for the chat router's token batching. DB-free, no network."""
+
+import asyncio
+import time
+
+from app.routers.chat import _TOKEN_FLUSH_INTERVAL_SECONDS, _coalesce_tokens
+
+
+async def test_coalesce_tokens_flushes_on_provider_stall():
+    closed = []
+
+    async def stream():
+        try:
+            yield "a"
+            yield "b"
+            await asyncio.sleep(0.3)  # provider pauses mid-answer
+            yield "c"
+        finally:
+            closed.append(True)
+
+    start = time.monotonic()
+    received = []
+    async for chunk in _coalesce_tokens(stream()):
+        received.append((chunk, time.monotonic() - start))
+
+    assert "".join(chunk for chunk, _ in received) == "abc"
+    # "b" is held back by the window but must not wait out the stall.
+    b_sent_at = next(at for chunk, at in received if "b" in chunk)
+    assert b_sent_at < 0.3 - _TOKEN_FLUSH_INTERVAL_SECONDS
+    assert closed == [True]
+
+
+async def test_coalesce_tokens_close_stops_upstream():
+    cancelled = []
+
+    async def stream():
+        try:
+            yield "a"
+            await asyncio.sleep(3600)
+            yield "never"
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    chunks = _coalesce_tokens(stream())
+    assert await anext(chunks) == "a"
+    await chunks.aclose()
+    assert cancelled == [True]
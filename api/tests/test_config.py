@@ -0,0 +1,19 @@
+"""Guards for app settings loading. DB-free."""
+
+from pathlib import Path
+
+import app
+from app.core import config
+
+
+def test_single_config_module():
+    modules = sorted(
+        p.relative_to(Path(app.__file__).parent).as_posix()
+        for p in Path(app.__file__).parent.rglob("config.py")
+    )
+    assert modules == ["core/config.py"]
+
+
+def test_settings_parsed_once():
+    assert config.get_settings() is config.get_settings()
+    assert config.settings is config.get_settings()
@@ -25,6 +25,13 @@ def test_list_entries(auth_client):
     assert len(data) > 0
 
 
+def test_list_entries_limit_validation(auth_client):
+    assert auth_client.get("/entries?limit=0").status_code == 422
+    assert auth_client.get("/entries?limit=501").status_code == 422
+    assert auth_client.get("/entries?skip=-1").status_code == 422
+    assert auth_client.get("/entries?limit=500").status_code == 200
+
+
 def test_get_entry(auth_client):
     create_response = auth_client.post(
         "/entries",
@@ -191,3 +198,128 @@ def test_search_finds_match_beyond_1000_entries(auth_client):
     results = response.json()
     assert len(results) == 1
     assert needle in results[0]["content"]
+
+
+def test_search_filters_by_tag_containment(auth_client):
+    auth_client.post(
+        "/entries",
+        json={"content": "tagged haystack", "tags": ["tagfilter-a", "tagfilter-b"]},
+    )
+    auth_client.post(
+        "/entries",
+        json={"content": "untagged haystack", "tags": ["tagfilter-b"]},
+    )
+
+    response = auth_client.post(
+        "/search",
+        json={"query": "haystack", "k": 10, "tags": ["tagfilter-a"]},
+    )
+
+    assert response.status_code == 200
+    results = response.json()
+    assert [r["content"] for r in results] == ["tagged haystack"]
+
+
+def test_list_query_uses_active_entry_partial_index(auth_client):
+    """The soft-delete filter must render so the partial index predicate matches."""
+    from sqlalchemy import false, text
+
+    from app.database import SessionLocal
+    from app.models.entry import Entry
+    from app.models.user import User
+
+    auth_client.post("/entries", json={"content": "plan check"})
+
+    db = SessionLocal()
+    try:
+        user = db.query(User).filter(User.username == "entriesuser").first()
+        query = (
+            db.query(Entry)
+            .filter(Entry.user_id == user.id, Entry.is_deleted == false())
+            .order_by(Entry.created_at.desc())
+            .limit(100)
+        )
+        compiled = query.statement.compile(
+            dialect=db.get_bind().dialect, compile_kwargs={"literal_binds": True}
+        )
+        # Tiny test tables would otherwise always get a sequential scan.
+        db.execute(text("SET LOCAL enable_seqscan = off"))
+        plan = db.execute(text(f"EXPLAIN (FORMAT JSON) {compiled}")).scalar()
+    finally:
+        db.rollback()
+        db.close()
+
+    assert "idx_entries_active_user" in str(plan)
+
+
+def test_update_with_unchanged_content_keeps_reflection(auth_client):
+    from app.database import SessionLocal
+    from app.models.entry import Entry
+
+    entry_id = auth_client.post(
+        "/entries", json={"content": "Same words every save"}
+    ).json()["id"]
+    db = SessionLocal()
+    try:
+        db.get(Entry, entry_id).reflection = "cached reflection"
+        db.commit()
+    finally:
+        db.close()
+
+    auth_client.put(
+        f"/entries/{entry_id}",
+        json={"content": "Same words every save", "tags": ["a"]},
+    )
+    db = SessionLocal()
+    try:
+        assert db.get(Entry, entry_id).reflection == "cached reflection"
+    finally:
+        db.close()
+
+    auth_client.put(f"/entries/{entry_id}", json={"content": "New words"})
+    db = SessionLocal()
+    try:
+        assert db.get(Entry, entry_id).reflection is None
+    finally:
+        db.close()
+
+
+def test_export_streams_one_json_object_per_entry(auth_client):
+    import json
+
+    created = {
+        auth_client.post(
+            "/entries", json={"title": f"Export {i}", "content": f"export body {i}"}
+        ).json()["id"]
+        for i in range(3)
+    }
+    response = auth_client.get("/export/entries")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    exported = {
+        row["id"]: row
+        for row in map(json.loads, response.text.splitlines())
+    }
+    assert created <= exported.keys()
+    some_id = min(created)
+    assert exported[some_id]["content"].startswith("export body")
+
+
+def test_forget_soft_wipes_entry(auth_client):
+    from app.database import SessionLocal
+    from app.models.entry import Entry
+
+    entry_id = auth_client.post(
+        "/entries",
+        json={"title": "Secret", "content": "private words", "tags": ["x"], "mood_user": 2},
+    ).json()["id"]
+    assert auth_client.post(f"/forget/{entry_id}").status_code == 204
+    assert auth_client.get(f"/entries/{entry_id}").status_code == 404
+
+    db = SessionLocal()
+    try:
+        entry = db.get(Entry, entry_id)
+        assert entry.is_deleted is True
+        assert (entry.content, entry.title, entry.tags, entry.mood_user) == ("", None, [], None)
+    finally:
+        db.close()
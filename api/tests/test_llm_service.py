@@ -0,0 +1,44 @@
+"""Tests for LLMService's pooled HTTP client. DB-free, no network."""
+
+import httpx
+
+from app.celery_app import run_async
+from app.services.llm_service import LLMService, _shared_client, close_shared_client
+
+
+async def test_shared_client_reused_within_loop():
+    assert _shared_client() is _shared_client()
+
+
+def test_run_async_reuses_loop_and_client():
+    async def grab():
+        return _shared_client()
+
+    assert run_async(grab()) is run_async(grab())
+
+
+async def test_shared_client_keeps_no_cookies():
+    client = _shared_client()
+    client.cookies.extract_cookies(
+        httpx.Response(
+            200,
+            headers={"set-cookie": "session=abc; Path=/"},
+            request=httpx.Request("GET", "http://provider.example/v1/chat/completions"),
+        )
+    )
+    assert not client.cookies
+
+
+async def test_close_shared_client_closes_and_forgets_it():
+    client = _shared_client()
+    await close_shared_client()
+    assert client.is_closed
+    assert _shared_client() is not client
+    await close_shared_client()
+
+
+def test_auth_header_is_per_request():
+    assert LLMService("http://x", "m", api_token="t")._request_headers() == {
+        "Authorization": "Bearer t"
+    }
+    assert LLMService("http://x", "m")._request_headers() == {}